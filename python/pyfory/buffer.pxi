@@ -125,7 +125,7 @@ cdef class Buffer:
         object output_stream
         Py_ssize_t shape[1]
         Py_ssize_t stride[1]
-        int32_t max_binary_size
+    cdef readonly int32_t max_binary_size
 
     def __init__(self,  data not None, int32_t offset=0, length=None, int32_t max_binary_size= 64 * 1024 * 1024):
         self.data = data
@@ -150,6 +150,22 @@ def compile_function(
     stmts.insert(0, f"def {sanitized_function_name}({', '.join(params)}):")
     stmts = [f"{statement}  # line {idx + 1}" for idx, statement in enumerate(stmts)]
     code = "\n".join(stmts)
+    compiled = _compiled_code.get(code)
+    if compiled is None:
+        compiled = _compile_code(function_name, code)
+        _compiled_code[code] = compiled
+    exec(compiled, context, context)
+    # Use the sanitized function name to retrieve the function from context
+    sanitized_function_name = _sanitize_function_name(function_name)
+    return code, context[sanitized_function_name]
+
+
+# Generated source -> code object. Serializers rebuilt for the same layout generate
+# the same source, so each distinct source is compiled and registered in linecache once.
+_compiled_code = {}
+
+
+def _compile_code(function_name: str, code: str):
     filename = _generate_filename(function_name)
     code_dir = _get_code_dir()
     if code_dir:
@@ -163,7 +179,6 @@ def compile_function(
         compiled = compile(code, filename, "exec")
     except Exception as e:
         raise CompileError(f"Failed to compile code:\n{code}") from e
-    exec(compiled, context, context)
     # See https://stackoverflow.com/questions/64879414/how-does-attrs-fool-the-debugger-to-step-into-auto-generated-code # noqa: E501
     # In order of debuggers like PDB being able to step through the code,
     # we add a fake linecache entry.
@@ -173,9 +188,12 @@ def compile_function(
         code.splitlines(True),
         filename,
     )
-    # Use the sanitized function name to retrieve the function from context
-    sanitized_function_name = _sanitize_function_name(function_name)
-    return code, context[sanitized_function_name]
+    return compiled
+
+
+# Next free filename suffix per generated function name, so repeated generation
+# for the same name does not rescan every previously reserved filename.
+_filename_suffixes = {}
 
 
 # Based on https://github.com/python-attrs/attrs/blob/32fb12789e5cba4b2e71c09e47196b10763ddd7d/src/attr/_make.py#L1863 # noqa: E501
@@ -185,23 +203,20 @@ def _generate_filename(func_name):
     """
     # Sanitize the function name for filename
     sanitized_name = _sanitize_function_name(func_name)
-    unique_id = uuid.uuid4()
-    extra = "0"
-    count = 1
+    unique_id = str(uuid.uuid4())
+    count = _filename_suffixes.get(sanitized_name, 0)
 
     while True:
-        filename = f"fory_generated_{sanitized_name}_{extra}.py"
+        filename = f"fory_generated_{sanitized_name}_{count}.py"
+        count += 1
         # To handle concurrency we essentially "reserve" our spot in
         # the linecache with a dummy line.  The caller can then
         # set this value correctly.
-        cache_line = (1, None, [str(unique_id)], filename)
+        cache_line = (1, None, [unique_id], filename)
         if linecache.cache.setdefault(filename, cache_line) == cache_line:
+            _filename_suffixes[sanitized_name] = count
             return filename
 
-        # Looks like this spot is taken. Try again.
-        count += 1
-        extra = "{0}".format(count)
-
 
 def _get_code_dir():
     code_dir = os.environ.get("FORY_CODE_DIR")
@@ -130,48 +130,57 @@ class CollectionSerializer(Serializer):
         else:
             self._write_different_types(write_context, value, collect_flag)
 
+    # Element loops bind per-element methods to locals up front; these loops run
+    # once per element in pure-Python mode.
     def _write_same_type_no_ref(self, write_context, value, serializer):
+        write = serializer.write
         for item in value:
-            serializer.write(write_context, item)
+            write(write_context, item)
 
     def _write_same_type_has_null(self, write_context, value, serializer):
+        write = serializer.write
+        write_int8 = write_context.write_int8
         for item in value:
             if item is None:
-                write_context.write_int8(NULL_FLAG)
+                write_int8(NULL_FLAG)
             else:
-                write_context.write_int8(NOT_NULL_VALUE_FLAG)
-                serializer.write(write_context, item)
+                write_int8(NOT_NULL_VALUE_FLAG)
+                write(write_context, item)
 
     def _write_same_type_ref(self, write_context, value, serializer):
-        ref_writer = write_context.ref_writer
+        write = serializer.write
+        write_ref_or_null = write_context.ref_writer.write_ref_or_null
         for item in value:
-            if not ref_writer.write_ref_or_null(write_context, item):
-                serializer.write(write_context, item)
+            if not write_ref_or_null(write_context, item):
+                write(write_context, item)
 
     def _write_different_types(self, write_context, value, collect_flag=0):
         tracking_ref = (collect_flag & COLL_TRACKING_REF) != 0
         has_null = (collect_flag & COLL_HAS_NULL) != 0
-        ref_writer = write_context.ref_writer
+        get_type_info = self.type_resolver.get_type_info
+        write_type_info = self.type_resolver.write_type_info
         if tracking_ref:
+            write_ref_or_null = write_context.ref_writer.write_ref_or_null
             for item in value:
-                if not ref_writer.write_ref_or_null(write_context, item):
-                    typeinfo = self.type_resolver.get_type_info(type(item))
-                    self.type_resolver.write_type_info(write_context, typeinfo)
+                if not write_ref_or_null(write_context, item):
+                    typeinfo = get_type_info(type(item))
+                    write_type_info(write_context, typeinfo)
                     typeinfo.serializer.write(write_context, item)
             return
         if not has_null:
             for item in value:
-                typeinfo = self.type_resolver.get_type_info(type(item))
-                self.type_resolver.write_type_info(write_context, typeinfo)
+                typeinfo = get_type_info(type(item))
+                write_type_info(write_context, typeinfo)
                 typeinfo.serializer.write(write_context, item)
             return
+        write_int8 = write_context.write_int8
         for item in value:
             if item is None:
-                write_context.write_int8(NULL_FLAG)
+                write_int8(NULL_FLAG)
             else:
-                write_context.write_int8(NOT_NULL_VALUE_FLAG)
-                typeinfo = self.type_resolver.get_type_info(type(item))
-                self.type_resolver.write_type_info(write_context, typeinfo)
+                write_int8(NOT_NULL_VALUE_FLAG)
+                typeinfo = get_type_info(type(item))
+                write_type_info(write_context, typeinfo)
                 typeinfo.serializer.write(write_context, item)
 
     def read(self, read_context):
@@ -211,56 +220,68 @@ class CollectionSerializer(Serializer):
 
     def _read_same_type_no_ref(self, read_context, length, collection_, serializer):
         read_context.increase_depth()
+        add_element = self._add_element
+        read_no_ref = read_context.read_no_ref
         for _ in range(length):
-            self._add_element(collection_, read_context.read_no_ref(serializer=serializer))
+            add_element(collection_, read_no_ref(serializer=serializer))
         read_context.decrease_depth()
 
     def _read_same_type_has_null(self, read_context, length, collection_, serializer):
         read_context.increase_depth()
+        add_element = self._add_element
+        read_int8 = read_context.read_int8
+        read_no_ref = read_context.read_no_ref
         for _ in range(length):
-            if read_context.read_int8() == NULL_FLAG:
-                self._add_element(collection_, None)
+            if read_int8() == NULL_FLAG:
+                add_element(collection_, None)
             else:
-                self._add_element(collection_, read_context.read_no_ref(serializer=serializer))
+                add_element(collection_, read_no_ref(serializer=serializer))
         read_context.decrease_depth()
 
     def _read_same_type_ref(self, read_context, length, collection_, serializer):
         read_context.increase_depth()
         ref_reader = read_context.ref_reader
+        add_element = self._add_element
+        read = serializer.read
+        try_preserve_ref_id = ref_reader.try_preserve_ref_id
         for _ in range(length):
-            ref_id = ref_reader.try_preserve_ref_id(read_context)
+            ref_id = try_preserve_ref_id(read_context)
             if ref_id < NOT_NULL_VALUE_FLAG:
                 obj = ref_reader.get_read_ref()
             else:
-                obj = serializer.read(read_context)
+                obj = read(read_context)
                 ref_reader.set_read_ref(ref_id, obj)
-            self._add_element(collection_, obj)
+            add_element(collection_, obj)
         read_context.decrease_depth()
 
     def _read_different_types(self, read_context, length, collection_, collect_flag):
         read_context.increase_depth()
         tracking_ref = (collect_flag & COLL_TRACKING_REF) != 0
         has_null = (collect_flag & COLL_HAS_NULL) != 0
+        add_element = self._add_element
         if tracking_ref:
             for _ in range(length):
-                self._add_element(collection_, get_next_element(read_context))
+                add_element(collection_, get_next_element(read_context))
             read_context.decrease_depth()
             return
+        read_type_info = self.type_resolver.read_type_info
+        read_no_ref = read_context.read_no_ref
         if not has_null:
             for _ in range(length):
-                typeinfo = self.type_resolver.read_type_info(read_context)
-                elem = None if typeinfo is None else read_context.read_no_ref(serializer=typeinfo.serializer)
-                self._add_element(collection_, elem)
+                typeinfo = read_type_info(read_context)
+                elem = None if typeinfo is None else read_no_ref(serializer=typeinfo.serializer)
+                add_element(collection_, elem)
             read_context.decrease_depth()
             return
+        read_int8 = read_context.read_int8
         for _ in range(length):
-            head_flag = read_context.read_int8()
+            head_flag = read_int8()
             if head_flag == NULL_FLAG:
                 elem = None
             else:
-                typeinfo = self.type_resolver.read_type_info(read_context)
-                elem = None if typeinfo is None else read_context.read_no_ref(serializer=typeinfo.serializer)
-            self._add_element(collection_, elem)
+                typeinfo = read_type_info(read_context)
+                elem = None if typeinfo is None else read_no_ref(serializer=typeinfo.serializer)
+            add_element(collection_, elem)
         read_context.decrease_depth()
 
 
@@ -1104,6 +1104,14 @@ cdef class ReadContext:
     cpdef read_string(self):
         return self.buffer.read_string()
 
+    cpdef skip_string(self):
+        cdef uint64_t size = self.read_var_uint64() >> 2
+        if size > <uint64_t>self.buffer.max_binary_size:
+            raise ValueError(f"String size {size} exceeds the configured limit of {self.buffer.max_binary_size}")
+        if size > <uint64_t>2147483647:
+            raise ValueError(f"String size {size} exceeds the maximum supported size")
+        self.buffer.skip(<int32_t>size)
+
     cpdef read_bytes(self, int32_t length):
         return self.buffer.read_bytes(length)
 
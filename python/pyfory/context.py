@@ -186,12 +186,14 @@ class MetaStringReader:
         buffer.check_bound(reader_index, length)
         data = buffer.get_bytes(reader_index, length)
         buffer.set_reader_index(reader_index + length)
-        canonical_hash = hash_meta_string_data(data, encoding)
-        if canonical_hash != hashcode:
-            raise ValueError("Malformed metastring hash")
         key = (hashcode, data)
         encoded_meta_string = self._hash_to_encoded_meta_strings.get(key)
         if encoded_meta_string is None:
+            # Cache hits skip rehashing: entries are keyed by the exact bytes and are
+            # only added after the hash below has been validated.
+            canonical_hash = hash_meta_string_data(data, encoding)
+            if canonical_hash != hashcode:
+                raise ValueError("Malformed metastring hash")
             encoded_meta_string = self.shared_registry.get_or_create_encoded_meta_string(data, hashcode)
             if length <= MAX_CACHED_META_STRING_LENGTH and len(self._hash_to_encoded_meta_strings) < MAX_CACHED_META_STRINGS:
                 self._hash_to_encoded_meta_strings[key] = encoded_meta_string
@@ -715,3 +717,11 @@ class ReadContext:
 
     def read_string(self):
         return self.buffer.read_string()
+
+    def skip_string(self):
+        size = self.buffer.read_var_uint64() >> 2
+        if size > self.buffer.max_binary_size:
+            raise ValueError(f"String size {size} exceeds the configured limit of {self.buffer.max_binary_size}")
+        if size > 2147483647:
+            raise ValueError(f"String size {size} exceeds the maximum supported size")
+        self.buffer.skip(size)
@@ -189,8 +189,11 @@ def _same_float_value(left: float, right: float) -> bool:
     return left == right
 
 
+_FLOAT32_STRUCT = _struct.Struct(">f")
+
+
 def _to_float32(value: float) -> float:
-    return _struct.unpack(">f", _struct.pack(">f", value))[0]
+    return _FLOAT32_STRUCT.unpack(_FLOAT32_STRUCT.pack(value))[0]
 
 
 def _to_float_domain(value: float, type_id: int) -> float:
@@ -17,6 +17,7 @@
 
 import enum
 import array
+import sys
 import typing
 from typing import List
 from pyfory.annotation import ArrayMeta
@@ -151,6 +152,18 @@ def _typedef_header_hash(encoded: bytes, header_low_bits: int) -> int:
 
 
 class TypeDef:
+    __slots__ = (
+        "cls",
+        "encoded",
+        "fields",
+        "is_compressed",
+        "local_field_infos",
+        "namespace",
+        "type_id",
+        "typename",
+        "user_type_id",
+    )
+
     def __init__(
         self,
         namespace: str,
@@ -170,6 +183,8 @@ class TypeDef:
         self.fields = fields
         self.encoded = encoded
         self.is_compressed = is_compressed
+        # Field infos of the local class, set when this TypeDef was encoded from it.
+        self.local_field_infos = None
 
     def create_fields_serializer(self, resolver, resolved_field_names=None, local_field_types=None):
         """Create serializers for each field.
@@ -237,7 +252,7 @@ class TypeDef:
                     # Try converting snake_case to camelCase
                     camel_name = _snake_to_camel(wire_name)
                     if camel_name in class_field_names:
-                        resolved_names.append(camel_name)
+                        resolved_names.append(sys.intern(camel_name))
                     else:
                         # Fallback: use the wire name as-is
                         resolved_names.append(wire_name)
@@ -262,7 +277,9 @@ class TypeDef:
         # Resolve actual field names from TAG_ID encoding if needed
         field_names = self._resolve_field_names_from_tag_ids()
 
-        local_field_infos = build_field_infos(resolver, self.cls)
+        local_field_infos = self.local_field_infos
+        if local_field_infos is None:
+            local_field_infos = build_field_infos(resolver, self.cls)
         local_infos_by_name = {field_info.name: field_info for field_info in local_field_infos}
         local_infos_by_tag = {field_info.tag_id: field_info for field_info in local_field_infos if field_info.tag_id >= 0}
         local_field_types = infer_field_types(self.cls, field_nullable=resolver.field_nullable)
@@ -345,8 +362,12 @@ def _snake_to_camel(s: str) -> str:
 
 
 class FieldInfo:
+    __slots__ = ("defined_class", "field_type", "name", "tag_id")
+
     def __init__(self, name: str, field_type: "FieldType", defined_class: str, tag_id: int = -1):
-        self.name = name
+        # Interned so wire-decoded names match local field names and instance
+        # dict keys by identity.
+        self.name = sys.intern(name)
         self.field_type = field_type
         self.defined_class = defined_class
         self.tag_id = tag_id  # -1 is the internal no-ID sentinel, >=0 = use tag ID encoding
@@ -21,6 +21,7 @@ TypeDef decoder for xlang serialization.
 This module implements the decoding of TypeDef objects according to the xlang serialization specification.
 """
 
+import weakref
 from dataclasses import make_dataclass
 from typing import List, Any
 from pyfory.serialization import Buffer
@@ -55,6 +56,9 @@ from pyfory.meta.metastring import MetaStringDecoder, Encoding
 MAX_GENERATED_CLASSES = 1000
 MAX_FIELDS_PER_CLASS = 256
 _generated_class_count = 0
+# (namespace, typename, field names) -> dataclass generated for an unregistered struct TypeDef.
+# Every Fory instance that receives the same unknown TypeDef reuses one class while it is alive.
+_generated_classes = weakref.WeakValueDictionary()
 
 
 # Meta string decoders
@@ -170,18 +174,22 @@ def decode_typedef(buffer: Buffer, resolver, header=None) -> TypeDef:
     if type_cls is None and is_struct_typedef_kind(type_id):
         if getattr(resolver, "strict", False) and not getattr(resolver, "_allow_unregistered_typedef", False):
             raise ValueError(f"TypeDef {name} is not registered in strict mode")
-        # Check generated class count limit
-        if _generated_class_count >= MAX_GENERATED_CLASSES:
-            raise ValueError(
-                f"Exceeded maximum number of dynamically generated classes ({MAX_GENERATED_CLASSES}). "
-                "This may indicate malicious data causing memory issues."
-            )
-        _generated_class_count += 1
-        # Generate dynamic dataclass from field definitions
-        field_definitions = [(field_info.name, Any) for field_info in field_infos]
         # Use a valid Python identifier for class name
         class_name = typename.replace(".", "_").replace("$", "_")
-        type_cls = make_dataclass(class_name, field_definitions)
+        class_key = (namespace, typename, tuple(field_info.name for field_info in field_infos))
+        type_cls = _generated_classes.get(class_key)
+        if type_cls is None:
+            # Check generated class count limit
+            if _generated_class_count >= MAX_GENERATED_CLASSES:
+                raise ValueError(
+                    f"Exceeded maximum number of dynamically generated classes ({MAX_GENERATED_CLASSES}). "
+                    "This may indicate malicious data causing memory issues."
+                )
+            _generated_class_count += 1
+            # Generate dynamic dataclass from field definitions
+            field_definitions = [(field_info.name, Any) for field_info in field_infos]
+            type_cls = make_dataclass(class_name, field_definitions)
+            _generated_classes[class_key] = type_cls
         policy = getattr(resolver, "policy", None)
         if policy is not None:
             policy.validate_class(type_cls, is_local=True)
@@ -49,6 +49,10 @@ NAMESPACE_ENCODER = MetaStringEncoder(".", "_")
 TYPENAME_ENCODER = MetaStringEncoder("$", "_")
 FIELD_NAME_ENCODER = MetaStringEncoder("$", "_")
 
+# Field name -> (encoding flags, encoded bytes). Meta string encoding is pure-Python
+# bit packing and the same field names are encoded again for every Fory instance.
+_field_name_encodings = {}
+
 
 def encode_typedef(type_resolver, cls, include_fields: bool = True):
     """
@@ -126,6 +130,10 @@ def encode_typedef(type_resolver, cls, include_fields: bool = True):
         is_compressed,
         user_type_id=user_type_id,
     )
+    if include_fields and is_struct_typedef_kind(type_id):
+        # Serializers built from this TypeDef match against the same local fields,
+        # so hand them over instead of reflecting over the class a second time.
+        result.local_field_infos = field_infos
     return result
 
 
@@ -240,11 +248,9 @@ def write_field_info(buffer: Buffer, field_info: FieldInfo):
         field_info.field_type.write(buffer, False)
     else:
         # Field name encoding
-        encoding = FIELD_NAME_ENCODER.compute_encoding(field_info.name, FIELD_NAME_ENCODINGS)
-        meta_string = FIELD_NAME_ENCODER.encode_with_encoding(field_info.name, encoding)
+        encoding_flags, encoded_name = _encode_field_name(field_info.name)
         # Store (length - 1) in size field, matching Java TypeDefEncoder
-        field_name_binary_size = len(meta_string.encoded_data) - 1
-        encoding_flags = FIELD_NAME_ENCODINGS.index(meta_string.encoding)
+        field_name_binary_size = len(encoded_name) - 1
         header |= encoding_flags << 6  # encoding at bits 6-7
 
         if field_name_binary_size >= FIELD_NAME_SIZE_THRESHOLD:
@@ -259,4 +265,14 @@ def write_field_info(buffer: Buffer, field_info: FieldInfo):
         field_info.field_type.write(buffer, False)
 
         # Write field name meta string
-        buffer.write_bytes(meta_string.encoded_data)
+        buffer.write_bytes(encoded_name)
+
+
+def _encode_field_name(field_name: str):
+    encoded = _field_name_encodings.get(field_name)
+    if encoded is None:
+        encoding = FIELD_NAME_ENCODER.compute_encoding(field_name, FIELD_NAME_ENCODINGS)
+        meta_string = FIELD_NAME_ENCODER.encode_with_encoding(field_name, encoding)
+        encoded = (FIELD_NAME_ENCODINGS.index(meta_string.encoding), meta_string.encoded_data)
+        _field_name_encodings[field_name] = encoded
+    return encoded
@@ -351,6 +351,7 @@ class TypeResolver:
         "_hash_to_type_info",
         "_ns_type_to_type_info",
         "_named_type_to_type_info",
+        "_typename_to_type_infos",
         "namespace_encoder",
         "namespace_decoder",
         "typename_encoder",
@@ -389,6 +390,8 @@ class TypeResolver:
         self._types_info = dict()
         self._ns_type_to_type_info = dict()
         self._named_type_to_type_info = dict()
+        # typename -> {namespace: typeinfo}, for namespace-lenient lookups of unresolved names.
+        self._typename_to_type_infos = dict()
         self.namespace_encoder = MetaStringEncoder(".", "_")
         self.namespace_decoder = MetaStringDecoder(".", "_")
         self._meta_shared_type_info = {}
@@ -751,6 +754,7 @@ class TypeResolver:
             type_meta_bytes = self.shared_registry.get_encoded_meta_string(type_metastr)
             typeinfo = TypeInfo(cls, type_id, user_type_id, serializer, ns_meta_bytes, type_meta_bytes, dynamic_type)
             self._named_type_to_type_info[(namespace, typename)] = typeinfo
+            self._typename_to_type_infos.setdefault(typename, {})[namespace] = typeinfo
             self._ns_type_to_type_info[(ns_meta_bytes, type_meta_bytes)] = typeinfo
         self._types_info[cls] = typeinfo
         if type_id is not None and type_id != 0:
@@ -1064,7 +1068,7 @@ class TypeResolver:
                     typename = split_typename
                     ns = split_ns
                 if typename and not self.strict:
-                    matches = [info for (reg_ns, reg_typename), info in self._named_type_to_type_info.items() if reg_typename == typename]
+                    matches = list(self._typename_to_type_infos.get(typename, {}).values())
                     if len(matches) == 1:
                         typeinfo = matches[0]
                         self._ns_type_to_type_info[(ns_metabytes, type_metabytes)] = typeinfo
@@ -1662,19 +1662,27 @@ class ObjectSerializer(Serializer):
             if isinstance(slots, str):
                 slots = [slots]
             self._slot_field_names = sorted(slots)
+        # (attribute names in __dict__ order, sorted names) of the last written
+        # instance; instances of one class almost always share a layout.
+        self._last_field_layout = ((), [])
 
     def write(self, write_context, value):
         if self._slot_field_names is not None:
             sorted_field_names = self._slot_field_names
         else:
             value_dict = getattr(value, "__dict__", None)
-            sorted_field_names = [] if value_dict is None else sorted(value_dict.keys())
+            field_names = () if value_dict is None else tuple(value_dict)
+            last_field_names, sorted_field_names = self._last_field_layout
+            if field_names != last_field_names:
+                sorted_field_names = sorted(field_names)
+                self._last_field_layout = (field_names, sorted_field_names)
 
         write_context.write_var_uint32(len(sorted_field_names))
+        write_string = write_context.write_string
+        write_ref = write_context.write_ref
         for field_name in sorted_field_names:
-            write_context.write_string(field_name)
-            field_value = getattr(value, field_name)
-            write_context.write_ref(field_value)
+            write_string(field_name)
+            write_ref(getattr(value, field_name))
 
     def read(self, read_context):
         policy = read_context.policy
@@ -1685,10 +1693,11 @@ class ObjectSerializer(Serializer):
         if num_fields > read_context.max_collection_size:
             raise ValueError(f"object field size {num_fields} exceeds the configured limit of {read_context.max_collection_size}")
         state = {}
+        read_string = read_context.read_string
+        read_ref = read_context.read_ref
         for _ in range(num_fields):
-            field_name = read_context.read_string()
-            field_value = read_context.read_ref()
-            state[field_name] = field_value
+            field_name = read_string()
+            state[field_name] = read_ref()
         policy.intercept_setstate(obj, state)
         for field_name, field_value in state.items():
             setattr(obj, field_name, field_value)
@@ -1702,10 +1711,13 @@ class _DefaultPolicyObjectSerializer(ObjectSerializer):
         num_fields = read_context.read_var_uint32()
         if num_fields > read_context.max_collection_size:
             raise ValueError(f"object field size {num_fields} exceeds the configured limit of {read_context.max_collection_size}")
+        # The field layout is self-described per object, so bind the readers
+        # once rather than resolving them for every field.
+        read_string = read_context.read_string
+        read_ref = read_context.read_ref
         for _ in range(num_fields):
-            field_name = read_context.read_string()
-            field_value = read_context.read_ref()
-            setattr(obj, field_name, field_value)
+            field_name = read_string()
+            setattr(obj, field_name, read_ref())
         return obj
 
 
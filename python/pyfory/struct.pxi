@@ -53,12 +53,12 @@ cdef class DataClassSerializer(Serializer):
     cdef public dict _dynamic_fields
     cdef public list _field_infos
     cdef public dict _field_metas
-    cdef public dict _unwrapped_hints
     cdef public int32_t _hash
     cdef public tuple _field_name_interned
     cdef tuple _serializer_owner
     cdef tuple _validation_field_type_owner
     cdef public dict _default_values_factory
+    cdef dict _missing_field_values
     cdef tuple _missing_field_defaults
     cdef public object _assign_fields
     cdef public object _assigned_field_names
@@ -80,12 +80,12 @@ cdef class DataClassSerializer(Serializer):
     ):
         super().__init__(type_resolver, clz)
 
-        from pyfory.lib.mmh3 import hash_buffer
         from pyfory.struct import (
             _extract_field_infos,
             build_default_values_factory,
             compute_struct_fingerprint,
             compute_struct_meta,
+            struct_fingerprint_hash,
             StructFieldSerializerVisitor,
         )
         from pyfory.type_util import get_type_hints, unwrap_optional, infer_field
@@ -138,24 +138,21 @@ cdef class DataClassSerializer(Serializer):
                 else:
                     self._serializers = list(serializers)
 
-        self._unwrapped_hints = self._compute_unwrapped_hints()
         if self._fields_from_typedef:
-            hash_str = compute_struct_fingerprint(
-                type_resolver,
-                self._field_names,
-                self._serializers,
-                self._nullable_fields,
-                self._field_infos,
-            )
-            hash_bytes = hash_str.encode("utf-8")
-            if len(hash_bytes) == 0:
-                self._hash = 47
+            # The struct hash is only written and checked in schema-consistent mode,
+            # so TypeDef-built serializers skip the fingerprint in compatible mode.
+            if type_resolver.compatible:
+                self._hash = 0
             else:
-                full_hash = hash_buffer(hash_bytes, seed=47)[0]
-                type_hash_32 = full_hash & 0xFFFFFFFF
-                if full_hash & 0x80000000:
-                    type_hash_32 -= 0x100000000
-                self._hash = type_hash_32
+                self._hash = struct_fingerprint_hash(
+                    compute_struct_fingerprint(
+                        type_resolver,
+                        self._field_names,
+                        self._serializers,
+                        self._nullable_fields,
+                        self._field_infos,
+                    )
+                )
         else:
             self._hash, self._field_names, self._serializers = compute_struct_meta(
                 type_resolver,
@@ -205,11 +202,6 @@ cdef class DataClassSerializer(Serializer):
             return sorted(slots)
         return []
 
-    cdef dict _compute_unwrapped_hints(self):
-        from pyfory.type_util import unwrap_optional
-
-        return {field_name: unwrap_optional(hint)[0] for field_name, hint in self._type_hints.items()}
-
     cdef inline uint8_t _resolve_basic_type_id(self, Serializer serializer, bint is_dynamic, object compatible_scalar_cls):
         cdef uint8_t type_id
         if is_dynamic or serializer is None:
@@ -320,6 +312,9 @@ cdef class DataClassSerializer(Serializer):
         cdef object field_name
         cdef object default_factory
 
+        from pyfory.struct import _ConstantDefault
+
+        self._missing_field_values = {}
         self._missing_field_defaults = ()
         if not self.type_resolver.compatible or not self._default_values_factory:
             return
@@ -330,7 +325,11 @@ cdef class DataClassSerializer(Serializer):
 
         defaults = []
         for field_name, default_factory in self._default_values_factory.items():
-            if field_name in missing_fields:
+            if field_name not in missing_fields:
+                continue
+            if type(default_factory) is _ConstantDefault:
+                self._missing_field_values[self._intern_field_name(field_name)] = default_factory.value
+            else:
                 defaults.append((self._intern_field_name(field_name), default_factory))
         self._missing_field_defaults = tuple(defaults)
 
@@ -429,7 +428,7 @@ cdef class DataClassSerializer(Serializer):
         else:
             self._read_dict(read_context, obj)
 
-        if self._missing_field_defaults:
+        if self._missing_field_values or self._missing_field_defaults:
             if self._has_slots:
                 self._apply_missing_defaults_slots(obj)
             else:
@@ -543,6 +542,16 @@ cdef class DataClassSerializer(Serializer):
                 )
 
     cdef inline object _read_missing_field_value(self, ReadContext read_context, FieldRuntimeInfo *field_info):
+        cdef uint8_t type_id = field_info.basic_type_id
+        if type_id != _BASIC_FIELD_NOT_INLINE:
+            # Basic values need no typedef lookups; strings are skipped by their
+            # length header instead of being decoded.
+            if field_info.is_nullable != 0 and read_context.read_int8() == NULL_FLAG:
+                return None
+            if type_id == <uint8_t>TypeId.STRING:
+                read_context.skip_string()
+                return None
+            return Fory_PyReadBasicFieldFromBuffer(read_context.c_buffer, type_id)
         cdef object resolver = self.type_resolver.resolver
         cdef object previous = resolver._allow_unregistered_typedef
         resolver._allow_unregistered_typedef = True
@@ -598,13 +607,18 @@ cdef class DataClassSerializer(Serializer):
         cdef object field_name
         cdef object default_factory
 
+        if self._missing_field_values:
+            obj_dict.update(self._missing_field_values)
         for field_name, default_factory in self._missing_field_defaults:
             obj_dict[field_name] = default_factory()
 
     cdef inline void _apply_missing_defaults_slots(self, object obj):
         cdef object field_name
+        cdef object value
         cdef object default_factory
 
+        for field_name, value in self._missing_field_values.items():
+            PyObject_SetAttr(obj, field_name, value)
         for field_name, default_factory in self._missing_field_defaults:
             PyObject_SetAttr(obj, field_name, default_factory())
 
@@ -620,6 +634,9 @@ cdef class DataClassStubSerializer(Serializer):
         return self._replace().read(read_context)
 
     cpdef object _replace(self):
+        # Containers may keep a reference to this stub, so reuse the serializer
+        # installed by the first replacement instead of rebuilding it per call.
         cdef TypeInfo typeinfo = self.type_resolver.get_type_info(self.type_)
-        typeinfo.serializer = DataClassSerializer(self.type_resolver, self.type_)
+        if type(typeinfo.serializer) is DataClassStubSerializer:
+            typeinfo.serializer = DataClassSerializer(self.type_resolver, self.type_)
         return typeinfo.serializer
@@ -23,6 +23,7 @@ import decimal
 import enum
 import inspect
 import logging
+import operator
 import os
 import sys
 import typing
@@ -59,6 +60,7 @@ from pyfory.types import (
     is_primitive_type,
     is_union_type,
 )
+from pyfory.codegen import compile_function
 from pyfory.type_util import (
     TypeVisitor,
     _get_args,
@@ -160,14 +162,17 @@ def _is_abstract_type(type_hint: type) -> bool:
         return False
 
 
+_COLLECTION_ORIGINS = frozenset((list, dict, set, tuple))
+_BARE_COLLECTION_TYPES = frozenset((list, dict, set, tuple, typing.List, typing.Dict, typing.Set, typing.Tuple))
+
+
 def _is_dynamic_nullable_default(type_hint: type) -> bool:
     if type_hint is typing.Any:
         return True
     origin = _get_origin(type_hint)
-    args = _get_args(type_hint)
-    if origin in (list, dict, set, tuple) and not args:
+    if origin in _COLLECTION_ORIGINS and not _get_args(type_hint):
         return True
-    return type_hint in (list, dict, set, tuple, typing.List, typing.Dict, typing.Set, typing.Tuple)
+    return type_hint in _BARE_COLLECTION_TYPES
 
 
 def _default_field_meta(type_hint: type, field_nullable: bool = False, xlang: bool = False) -> ForyFieldMeta:
@@ -220,16 +225,9 @@ def _extract_field_infos(
         # Non-dataclass registration uses the runtime type inspection path.
         return [], {}
 
-    # Collect fields from class hierarchy (parent first, child last)
-    # Child fields override parent fields with same name
-    all_fields: Dict[str, dataclasses.Field] = {}
-    for klass in clz.__mro__[::-1]:  # Reverse MRO: base classes first
-        if dataclasses.is_dataclass(klass) and klass is not clz:
-            for f in dataclasses.fields(klass):
-                all_fields[f.name] = f
-    # Add current class fields (override parent)
-    for f in dataclasses.fields(clz):
-        all_fields[f.name] = f
+    # dataclasses.fields() already walks the class hierarchy: parent fields come
+    # first and child fields override parent fields with the same name.
+    all_fields: Dict[str, dataclasses.Field] = {f.name: f for f in dataclasses.fields(clz)}
 
     # Extract field metas and filter ignored fields
     field_metas: Dict[str, ForyFieldMeta] = {}
@@ -313,7 +311,7 @@ def _extract_field_infos(
             effective_dynamic = is_polymorphic_type(type_id) and not fory.is_registered_by_id(unwrapped_type)
 
         field_info = FieldInfo(
-            name=field_name,
+            name=sys.intern(field_name),
             index=index,
             type_hint=type_hint,
             tag_id=meta.id,
@@ -331,6 +329,22 @@ def _extract_field_infos(
     return field_infos, field_metas
 
 
+class _ConstantDefault:
+    """Missing-field default that always yields the same default object.
+
+    Struct readers fold these into one bulk assignment instead of calling a
+    factory per missing field per object.
+    """
+
+    __slots__ = ("value",)
+
+    def __init__(self, value):
+        self.value = value
+
+    def __call__(self):
+        return self.value
+
+
 def resolve_missing_field_default(
     dc_field: dataclasses.Field,
     type_resolver,
@@ -347,7 +361,7 @@ def resolve_missing_field_default(
             members = tuple(unwrapped_type)
             if members:
                 default_value = members[0]
-        return lambda value=default_value: value
+        return _ConstantDefault(default_value)
 
     if dc_field.default_factory is not dataclasses.MISSING:
         return dc_field.default_factory
@@ -358,25 +372,24 @@ def resolve_missing_field_default(
         if is_subclass(unwrapped_type, enum.Enum):
             members = tuple(unwrapped_type)
             if members:
-                default_value = members[0]
-                return lambda value=default_value: value
-        if origin is list or origin == typing.List:
-            return lambda: []
-        if origin is set or origin == typing.Set:
-            return lambda: set()
-        if origin is dict or origin == typing.Dict:
-            return lambda: {}
+                return _ConstantDefault(members[0])
+        if origin is list or origin is typing.List:
+            return list
+        if origin is set or origin is typing.Set:
+            return set
+        if origin is dict or origin is typing.Dict:
+            return dict
         if unwrapped_type is bool:
-            return lambda: False
+            return _ConstantDefault(False)
         if unwrapped_type in _MISSING_DEFAULT_INT_TYPES:
-            return lambda: 0
+            return _ConstantDefault(0)
         if unwrapped_type in _MISSING_DEFAULT_FLOAT_TYPES:
-            return lambda: 0.0
+            return _ConstantDefault(0.0)
         if unwrapped_type is str:
-            return lambda: ""
+            return _ConstantDefault("")
         if unwrapped_type is bytes:
-            return lambda: b""
-    return lambda: None
+            return _ConstantDefault(b"")
+    return _ConstantDefault(None)
 
 
 def _resolve_missing_field_default(dc_field, type_resolver, type_hints):
@@ -458,18 +471,15 @@ class DataClassSerializer(Serializer):
                         unwrapped_type, _ = unwrap_optional(self._type_hints.get(key, typing.Any))
                         self._serializers[index] = infer_field(key, unwrapped_type, visitor, types_path=[])
 
-        self._unwrapped_hints = self._compute_unwrapped_hints()
         if self._fields_from_typedef:
-            hash_str = compute_struct_fingerprint(self.type_resolver, self._field_names, self._serializers, self._nullable_fields, self._field_infos)
-            hash_bytes = hash_str.encode("utf-8")
-            if len(hash_bytes) == 0:
-                self._hash = 47
+            # The struct hash is only written and checked in schema-consistent mode,
+            # so TypeDef-built serializers skip the fingerprint in compatible mode.
+            if self.type_resolver.compatible:
+                self._hash = 0
             else:
-                full_hash = hash_buffer(hash_bytes, seed=47)[0]
-                type_hash_32 = full_hash & 0xFFFFFFFF
-                if full_hash & 0x80000000:
-                    type_hash_32 -= 0x100000000
-                self._hash = type_hash_32
+                self._hash = struct_fingerprint_hash(
+                    compute_struct_fingerprint(self.type_resolver, self._field_names, self._serializers, self._nullable_fields, self._field_infos)
+                )
         else:
             self._hash, self._field_names, self._serializers = compute_struct_meta(
                 self.type_resolver, self._field_names, self._serializers, self._nullable_fields, self._field_infos
@@ -485,21 +495,25 @@ class DataClassSerializer(Serializer):
             getattr(self._field_infos[index], "validation_field_type", None) if index < len(self._field_infos) else None
             for index in range(len(self._field_names))
         ]
-        self._has_validation_fields = any(field_type is not None for field_type in self._validation_field_types)
         self._assigned_field_names = {
             field_name
             for index, field_name in enumerate(self._field_names)
             if self._assign_fields[index] and field_name in self._current_class_field_names
         }
-        self._has_missing_fields = any(
-            field_name not in self._current_class_field_names or not self._assign_fields[index] for index, field_name in enumerate(self._field_names)
-        )
         self._default_values_factory = (
             build_default_values_factory(self.type_resolver, self._type_hints, dataclasses.fields(self.type_))
             if dataclasses.is_dataclass(self.type_)
             else {}
         )
-        self._missing_field_defaults = self._build_missing_field_defaults()
+        self._missing_field_values, self._missing_field_defaults = self._build_missing_field_defaults()
+        if any(field_type is not None for field_type in self._validation_field_types):
+            from pyfory.meta.typedef import coerce_assignable_value, is_value_assignable
+
+            self._value_assignable_checker = is_value_assignable
+            self._value_assigner = coerce_assignable_value
+        else:
+            self._value_assignable_checker = None
+            self._value_assigner = None
         from pyfory.converter import CompatibleScalarFieldSerializer
 
         self._compatible_scalar_field_flags = [isinstance(serializer, CompatibleScalarFieldSerializer) for serializer in self._serializers]
@@ -509,6 +523,193 @@ class DataClassSerializer(Serializer):
             and isinstance(self._serializers[index], self._BASIC_SERIALIZERS)
             for index, field_name in enumerate(self._field_names)
         ]
+        # Frozen per-field rows so write/read loops unpack locals instead of
+        # doing one dict/list lookup per flag per field.
+        # Basic fields carry their bound writer so the generated writer dispatches
+        # with one call (after an inline null flag for nullable fields) instead
+        # of walking _write_field_value.
+        self._field_write_infos = tuple(
+            (
+                self._field_name_interned[field_name],
+                self._serializers[index].write if self._basic_field_flags[index] else None,
+                self._serializers[index],
+                self._nullable_fields.get(field_name, False),
+                self._dynamic_fields.get(field_name, False),
+                self._basic_field_flags[index],
+                self._ref_fields.get(field_name, False),
+            )
+            for index, field_name in enumerate(self._field_names)
+        )
+        # Basic fields carry their bound reader so the generated reader dispatches
+        # with one call (after an inline null flag check for nullable fields)
+        # instead of walking _read_field_value.
+        self._field_read_infos = tuple(
+            (
+                self._field_name_interned[field_name],
+                self._serializers[index].read if self._basic_field_flags[index] else None,
+                self._serializers[index],
+                self._nullable_fields.get(field_name, False),
+                self._dynamic_fields.get(field_name, False),
+                self._basic_field_flags[index],
+                self._ref_fields.get(field_name, False),
+                self._compatible_scalar_field_flags[index],
+                field_name in self._current_class_field_names and self._assign_fields[index],
+                self._validation_field_types[index],
+            )
+            for index, field_name in enumerate(self._field_names)
+        )
+        self._write_fields = self._gen_write_fields_method()
+        self._read_fields = self._gen_read_fields_method()
+
+    def _gen_write_fields_method(self):
+        """Generate a straight-line writer for this struct's field layout.
+
+        The struct hash, field access and per-field flags are folded into the
+        generated source, so writes skip the per-call mode checks and per-field
+        tuple unpacking of a generic loop.
+        """
+        compatible = self.type_resolver.compatible
+        context = {"write_field_value": self._write_field_value}
+        stmts = []
+        if not compatible:
+            stmts.append(f"write_context.write_int32({self._hash})")
+        if not self._has_slots and self._field_write_infos:
+            stmts.append("value_dict = value.__dict__")
+        for index, (
+            interned_name,
+            basic_write,
+            serializer,
+            is_nullable,
+            is_dynamic,
+            is_basic,
+            is_tracking_ref,
+        ) in enumerate(self._field_write_infos):
+            name_var = f"field_name{index}"
+            context[name_var] = interned_name
+            if self._has_slots:
+                value_expr = f"getattr(value, {name_var}, None)" if compatible else f"getattr(value, {name_var})"
+            else:
+                value_expr = f"value_dict.get({name_var})" if compatible else f"value_dict[{name_var}]"
+            if basic_write is not None and is_nullable:
+                context[f"write{index}"] = basic_write
+                stmts.extend(
+                    [
+                        f"field_value{index} = {value_expr}",
+                        f"if field_value{index} is None:",
+                        f"    write_context.write_int8({NULL_FLAG})",
+                        "else:",
+                        f"    write_context.write_int8({NOT_NULL_VALUE_FLAG})",
+                        f"    write{index}(write_context, field_value{index})",
+                    ]
+                )
+            elif basic_write is not None:
+                context[f"write{index}"] = basic_write
+                stmts.append(f"write{index}(write_context, {value_expr})")
+            else:
+                serializer_var = f"serializer{index}"
+                context[serializer_var] = serializer
+                stmts.append(
+                    f"write_field_value(write_context, {serializer_var}, {value_expr}, {bool(is_nullable)}, {bool(is_dynamic)}, "
+                    f"{bool(is_basic)}, {bool(is_tracking_ref)})"
+                )
+        if not stmts:
+            stmts.append("pass")
+        _, write_fields = compile_function(f"write_{self.type_.__name__}_fields", ["write_context", "value"], stmts, context)
+        return write_fields
+
+    def _gen_read_fields_method(self):
+        """Generate a straight-line reader for this struct's field layout.
+
+        The struct hash check, per-field flags and local defaults for fields the
+        peer did not send are folded into the generated source, so reads skip the
+        per-call mode check, the per-field branching a generic loop would need for
+        missing, validated, basic, ref-tracked and non-nullable fields, and a second
+        pass to fill defaults.
+        """
+        context = {
+            "read_field_value": self._read_field_value,
+            "read_missing_field_value": self._read_missing_field_value,
+            "validate_or_default": self._validate_or_default,
+            "raise_hash_mismatch": self._raise_hash_mismatch,
+        }
+        stmts = []
+        if not self.type_resolver.compatible:
+            stmts.extend(
+                [
+                    "read_hash = read_context.read_int32()",
+                    f"if read_hash != {self._hash}:",
+                    "    raise_hash_mismatch(read_hash)",
+                ]
+            )
+        for index, (
+            interned_name,
+            basic_read,
+            serializer,
+            is_nullable,
+            is_dynamic,
+            is_basic,
+            is_tracking_ref,
+            is_compatible_scalar_field,
+            is_assigned,
+            validation_field_type,
+        ) in enumerate(self._field_read_infos):
+            name_var = f"field_name{index}"
+            serializer_var = f"serializer{index}"
+            context[name_var] = interned_name
+            context[serializer_var] = serializer
+            read_args = (
+                f"read_context, {serializer_var}, {bool(is_nullable)}, {bool(is_dynamic)}, {bool(is_basic)}, "
+                f"{bool(is_tracking_ref)}, {bool(is_compatible_scalar_field)}"
+            )
+            if basic_read is not None:
+                context[f"read{index}"] = basic_read
+                value_expr = f"read{index}(read_context)"
+                if not is_assigned and isinstance(serializer, StringSerializer):
+                    # Strings missing locally are skipped by their length header instead of being decoded.
+                    value_expr = "read_context.skip_string()"
+                if is_nullable:
+                    value_expr = f"(None if read_context.read_int8() == {NULL_FLAG} else {value_expr})"
+                if not is_assigned:
+                    # Basic values need no typedef lookups, so fields missing locally are read and dropped.
+                    stmts.append(value_expr)
+                    continue
+            elif not is_assigned:
+                stmts.append(f"read_missing_field_value({read_args})")
+                continue
+            elif is_tracking_ref:
+                value_expr = "read_context.read_ref()" if is_dynamic else f"read_context.read_ref(serializer={serializer_var})"
+            elif not is_nullable:
+                value_expr = "read_context.read_no_ref()" if is_dynamic else f"read_context.read_no_ref(serializer={serializer_var})"
+            else:
+                value_expr = f"read_field_value({read_args})"
+            if validation_field_type is not None:
+                context[f"validation_field_type{index}"] = validation_field_type
+                value_expr = f"validate_or_default({name_var}, {value_expr}, validation_field_type{index})"
+            if self._has_slots:
+                stmts.append(f"setattr(obj, {name_var}, {value_expr})")
+            else:
+                stmts.append(f"obj_dict[{name_var}] = {value_expr}")
+        # Defaults for local fields the peer did not send are filled in the same pass.
+        if self._missing_field_values:
+            if self._has_slots:
+                for index, (field_name, value) in enumerate(self._missing_field_values.items()):
+                    context[f"missing_field_name{index}"] = field_name
+                    context[f"missing_field_value{index}"] = value
+                    stmts.append(f"setattr(obj, missing_field_name{index}, missing_field_value{index})")
+            else:
+                context["missing_field_values"] = self._missing_field_values
+                stmts.append("obj_dict.update(missing_field_values)")
+        for index, (field_name, default_factory) in enumerate(self._missing_field_defaults):
+            context[f"default_field_name{index}"] = field_name
+            context[f"default_factory{index}"] = default_factory
+            if self._has_slots:
+                stmts.append(f"setattr(obj, default_field_name{index}, default_factory{index}())")
+            else:
+                stmts.append(f"obj_dict[default_field_name{index}] = default_factory{index}()")
+        if not stmts:
+            stmts.append("pass")
+        _, read_fields = compile_function(f"read_{self.type_.__name__}_fields", ["read_context", "obj", "obj_dict"], stmts, context)
+        return read_fields
 
     def _get_field_names(self, clz):
         if hasattr(clz, "__dict__"):
@@ -522,16 +723,22 @@ class DataClassSerializer(Serializer):
             return sorted(slots)
         return []
 
-    def _compute_unwrapped_hints(self):
-        return {field_name: unwrap_optional(hint)[0] for field_name, hint in self._type_hints.items()}
-
     def _build_missing_field_defaults(self):
         if not self.type_resolver.compatible or not self._default_values_factory:
-            return []
+            return {}, []
         missing_fields = self._current_class_field_names - self._assigned_field_names
         if not missing_fields:
-            return []
-        return [(field_name, default_factory) for field_name, default_factory in self._default_values_factory.items() if field_name in missing_fields]
+            return {}, []
+        values = {}
+        factories = []
+        for field_name, default_factory in self._default_values_factory.items():
+            if field_name not in missing_fields:
+                continue
+            if type(default_factory) is _ConstantDefault:
+                values[sys.intern(field_name)] = default_factory.value
+            else:
+                factories.append((sys.intern(field_name), default_factory))
+        return values, factories
 
     def _write_field_value(self, write_context, serializer, field_value, is_nullable, is_dynamic, is_basic, is_tracking_ref):
         if is_basic:
@@ -593,177 +800,30 @@ class DataClassSerializer(Serializer):
             return None
         return default_factory()
 
-    def _assign_read_field_value(self, obj, obj_dict, field_name, field_value, validation_field_type):
-        if validation_field_type is not None:
-            from pyfory.meta.typedef import coerce_assignable_value, is_value_assignable
-
-            if not is_value_assignable(field_value, validation_field_type):
-                field_value = self._default_field_value(field_name)
-            else:
-                field_value = coerce_assignable_value(field_value, validation_field_type)
-        interned_name = self._field_name_interned[field_name]
-        if obj_dict is not None:
-            obj_dict[interned_name] = field_value
-        else:
-            setattr(obj, interned_name, field_value)
+    def _validate_or_default(self, field_name, field_value, validation_field_type):
+        if not self._value_assignable_checker(field_value, validation_field_type):
+            return self._default_field_value(field_name)
+        return self._value_assigner(field_value, validation_field_type)
 
     def write(self, write_context: Buffer, value):
-        if not self.type_resolver.compatible:
-            write_context.write_int32(self._hash)
-        value_dict = value.__dict__ if not self._has_slots else None
-        if value_dict is not None:
-            if self.type_resolver.compatible:
-                for index, field_name in enumerate(self._field_names):
-                    interned_name = self._field_name_interned[field_name]
-                    field_value = value_dict.get(interned_name)
-                    serializer = self._serializers[index]
-                    is_nullable = self._nullable_fields.get(field_name, False)
-                    is_dynamic = self._dynamic_fields.get(field_name, False)
-                    is_tracking_ref = self._ref_fields.get(field_name, False)
-                    is_basic = self._basic_field_flags[index]
-                    self._write_field_value(write_context, serializer, field_value, is_nullable, is_dynamic, is_basic, is_tracking_ref)
-            else:
-                for index, field_name in enumerate(self._field_names):
-                    interned_name = self._field_name_interned[field_name]
-                    field_value = value_dict[interned_name]
-                    serializer = self._serializers[index]
-                    is_nullable = self._nullable_fields.get(field_name, False)
-                    is_dynamic = self._dynamic_fields.get(field_name, False)
-                    is_tracking_ref = self._ref_fields.get(field_name, False)
-                    is_basic = self._basic_field_flags[index]
-                    self._write_field_value(write_context, serializer, field_value, is_nullable, is_dynamic, is_basic, is_tracking_ref)
-        else:
-            if self.type_resolver.compatible:
-                for index, field_name in enumerate(self._field_names):
-                    interned_name = self._field_name_interned[field_name]
-                    field_value = getattr(value, interned_name, None)
-                    serializer = self._serializers[index]
-                    is_nullable = self._nullable_fields.get(field_name, False)
-                    is_dynamic = self._dynamic_fields.get(field_name, False)
-                    is_tracking_ref = self._ref_fields.get(field_name, False)
-                    is_basic = self._basic_field_flags[index]
-                    self._write_field_value(write_context, serializer, field_value, is_nullable, is_dynamic, is_basic, is_tracking_ref)
-            else:
-                for index, field_name in enumerate(self._field_names):
-                    interned_name = self._field_name_interned[field_name]
-                    field_value = getattr(value, interned_name)
-                    serializer = self._serializers[index]
-                    is_nullable = self._nullable_fields.get(field_name, False)
-                    is_dynamic = self._dynamic_fields.get(field_name, False)
-                    is_tracking_ref = self._ref_fields.get(field_name, False)
-                    is_basic = self._basic_field_flags[index]
-                    self._write_field_value(write_context, serializer, field_value, is_nullable, is_dynamic, is_basic, is_tracking_ref)
+        self._write_fields(write_context, value)
         write_context.try_flush()
 
     def read(self, read_context):
         if read_context.policy is not DEFAULT_POLICY:
             read_context.policy.authorize_instantiation(self.type_)
-        if not self.type_resolver.compatible:
-            hash_ = read_context.read_int32()
-            if hash_ != self._hash:
-                raise TypeNotCompatibleError(
-                    f"Hash {hash_} is not consistent with {self._hash} for type {self.type_}",
-                )
         obj = self.type_.__new__(self.type_)
         read_context.reference(obj)
         obj_dict = obj.__dict__ if not self._has_slots else None
-        if self._has_missing_fields:
-            for index, field_name in enumerate(self._field_names):
-                serializer = self._serializers[index]
-                is_nullable = self._nullable_fields.get(field_name, False)
-                is_dynamic = self._dynamic_fields.get(field_name, False)
-                is_tracking_ref = self._ref_fields.get(field_name, False)
-                is_basic = self._basic_field_flags[index]
-                is_compatible_scalar_field = self._compatible_scalar_field_flags[index]
-                if field_name not in self._current_class_field_names or not self._assign_fields[index]:
-                    self._read_missing_field_value(
-                        read_context,
-                        serializer,
-                        is_nullable,
-                        is_dynamic,
-                        is_basic,
-                        is_tracking_ref,
-                        is_compatible_scalar_field,
-                    )
-                    continue
-                field_value = self._read_field_value(
-                    read_context,
-                    serializer,
-                    is_nullable,
-                    is_dynamic,
-                    is_basic,
-                    is_tracking_ref,
-                    is_compatible_scalar_field,
-                )
-                validation_field_type = self._validation_field_types[index]
-                if validation_field_type is None:
-                    interned_name = self._field_name_interned[field_name]
-                    if obj_dict is not None:
-                        obj_dict[interned_name] = field_value
-                    else:
-                        setattr(obj, interned_name, field_value)
-                else:
-                    self._assign_read_field_value(obj, obj_dict, field_name, field_value, validation_field_type)
-        else:
-            if not self._has_validation_fields:
-                for index, field_name in enumerate(self._field_names):
-                    serializer = self._serializers[index]
-                    is_nullable = self._nullable_fields.get(field_name, False)
-                    is_dynamic = self._dynamic_fields.get(field_name, False)
-                    is_tracking_ref = self._ref_fields.get(field_name, False)
-                    is_basic = self._basic_field_flags[index]
-                    is_compatible_scalar_field = self._compatible_scalar_field_flags[index]
-                    field_value = self._read_field_value(
-                        read_context,
-                        serializer,
-                        is_nullable,
-                        is_dynamic,
-                        is_basic,
-                        is_tracking_ref,
-                        is_compatible_scalar_field,
-                    )
-                    interned_name = self._field_name_interned[field_name]
-                    if obj_dict is not None:
-                        obj_dict[interned_name] = field_value
-                    else:
-                        setattr(obj, interned_name, field_value)
-            else:
-                for index, field_name in enumerate(self._field_names):
-                    serializer = self._serializers[index]
-                    is_nullable = self._nullable_fields.get(field_name, False)
-                    is_dynamic = self._dynamic_fields.get(field_name, False)
-                    is_tracking_ref = self._ref_fields.get(field_name, False)
-                    is_basic = self._basic_field_flags[index]
-                    is_compatible_scalar_field = self._compatible_scalar_field_flags[index]
-                    field_value = self._read_field_value(
-                        read_context,
-                        serializer,
-                        is_nullable,
-                        is_dynamic,
-                        is_basic,
-                        is_tracking_ref,
-                        is_compatible_scalar_field,
-                    )
-                    validation_field_type = self._validation_field_types[index]
-                    if validation_field_type is None:
-                        interned_name = self._field_name_interned[field_name]
-                        if obj_dict is not None:
-                            obj_dict[interned_name] = field_value
-                        else:
-                            setattr(obj, interned_name, field_value)
-                    else:
-                        self._assign_read_field_value(obj, obj_dict, field_name, field_value, validation_field_type)
-
-        if self._missing_field_defaults:
-            for field_name, default_factory in self._missing_field_defaults:
-                value = default_factory()
-                if obj_dict is not None:
-                    obj_dict[field_name] = value
-                else:
-                    setattr(obj, field_name, value)
+        self._read_fields(read_context, obj, obj_dict)
         read_context.shrink_input_buffer()
         return obj
 
+    def _raise_hash_mismatch(self, read_hash):
+        raise TypeNotCompatibleError(
+            f"Hash {read_hash} is not consistent with {self._hash} for type {self.type_}",
+        )
+
     def _read_missing_field_value(
         self,
         read_context,
@@ -801,45 +861,50 @@ class DataClassStubSerializer(DataClassSerializer):
         return self._replace().read(read_context)
 
     def _replace(self):
+        # Containers may keep a reference to this stub, so reuse the serializer
+        # installed by the first replacement instead of rebuilding it per call.
         typeinfo = self.type_resolver.get_type_info(self.type_)
-        typeinfo.serializer = DataClassSerializer(self.type_resolver, self.type_)
+        if type(typeinfo.serializer) is DataClassStubSerializer:
+            typeinfo.serializer = DataClassSerializer(self.type_resolver, self.type_)
         return typeinfo.serializer
 
 
-basic_types = {
-    bool,
-    # Signed integers
-    Int8,
-    Int16,
-    Int32,
-    FixedInt32,
-    Int64,
-    FixedInt64,
-    TaggedInt64,
-    # Unsigned integers
-    UInt8,
-    UInt16,
-    UInt32,
-    FixedUInt32,
-    UInt64,
-    FixedUInt64,
-    TaggedUInt64,
-    # Floats
-    Float16,
-    BFloat16,
-    Float32,
-    Float64,
-    # Python native types
-    int,
-    float,
-    str,
-    bytes,
-    datetime.datetime,
-    datetime.date,
-    datetime.time,
-    datetime.timedelta,
-    decimal.Decimal,
-}
+basic_types = frozenset(
+    {
+        bool,
+        # Signed integers
+        Int8,
+        Int16,
+        Int32,
+        FixedInt32,
+        Int64,
+        FixedInt64,
+        TaggedInt64,
+        # Unsigned integers
+        UInt8,
+        UInt16,
+        UInt32,
+        FixedUInt32,
+        UInt64,
+        FixedUInt64,
+        TaggedUInt64,
+        # Floats
+        Float16,
+        BFloat16,
+        Float32,
+        Float64,
+        # Python native types
+        int,
+        float,
+        str,
+        bytes,
+        datetime.datetime,
+        datetime.date,
+        datetime.time,
+        datetime.timedelta,
+        decimal.Decimal,
+    }
+)
 
 _ARRAY_ELEMENT_TYPE_IDS = {
     bool: TypeId.BOOL_ARRAY,
@@ -1021,6 +1086,22 @@ def _sort_fields(type_resolver, field_names, serializers, nullable_map=None, fie
     return [t[2] for t in all_types], [t[1] for t in all_types]
 
 
+_COMPRESSED_NUMERIC_TYPE_IDS = frozenset(
+    {
+        # Signed compressed types
+        TypeId.VARINT32,
+        TypeId.VARINT64,
+        TypeId.TAGGED_INT64,
+        # Unsigned compressed types
+        TypeId.VAR_UINT32,
+        TypeId.VAR_UINT64,
+        TypeId.TAGGED_UINT64,
+    }
+)
+_FIELD_SORT_KEY = operator.itemgetter(3)
+_FINGERPRINT_SORT_KEY = operator.itemgetter(0)
+
+
 def group_fields(type_resolver, field_names, serializers, nullable_map=None, field_infos_list=None):
     nullable_map = nullable_map or {}
     field_info_map = {}
@@ -1064,23 +1145,14 @@ def group_fields(type_resolver, field_names, serializers, nullable_map=None, fie
 
     def numeric_sorter(item):
         id_ = item[0]
-        compress = id_ in {
-            # Signed compressed types
-            TypeId.VARINT32,
-            TypeId.VARINT64,
-            TypeId.TAGGED_INT64,
-            # Unsigned compressed types
-            TypeId.VAR_UINT32,
-            TypeId.VAR_UINT64,
-            TypeId.TAGGED_UINT64,
-        }
+        compress = id_ in _COMPRESSED_NUMERIC_TYPE_IDS
         # Sort by: compress flag, -size (largest first), type_id (lower first), field_name
         return int(compress), -get_primitive_type_size(id_), id_, item[3]
 
     boxed_types = sorted(boxed_types, key=numeric_sorter)
     nullable_boxed_types = sorted(nullable_boxed_types, key=numeric_sorter)
-    non_primitive_types = sorted(non_primitive_types, key=lambda item: item[3])
-    other_types = sorted(other_types, key=lambda item: item[3])
+    non_primitive_types = sorted(non_primitive_types, key=_FIELD_SORT_KEY)
+    other_types = sorted(other_types, key=_FIELD_SORT_KEY)
     return (boxed_types, nullable_boxed_types, non_primitive_types, collection_types, set_types, map_types, other_types)
 
 
@@ -1145,7 +1217,7 @@ def compute_struct_fingerprint(type_resolver, field_names, serializers, nullable
         fp_fields.append((sort_key, field_id_or_name, type_fingerprint))
 
     # Sort fields: tag ID fields first (by ID), then name fields (lexicographically)
-    fp_fields.sort(key=lambda x: x[0])
+    fp_fields.sort(key=_FINGERPRINT_SORT_KEY)
 
     # Build fingerprint string
     hash_parts = []
@@ -1155,8 +1227,8 @@ def compute_struct_fingerprint(type_resolver, field_names, serializers, nullable
     return "".join(hash_parts)
 
 
-def _normalize_schema_fingerprint_type_id(type_id):
-    if type_id in {
+_UNKNOWN_FINGERPRINT_TYPE_IDS = frozenset(
+    {
         TypeId.UNKNOWN,
         TypeId.ENUM,
         TypeId.NAMED_ENUM,
@@ -1169,7 +1241,12 @@ def _normalize_schema_fingerprint_type_id(type_id):
         TypeId.UNION,
         TypeId.TYPED_UNION,
         TypeId.NAMED_UNION,
-    }:
+    }
+)
+
+
+def _normalize_schema_fingerprint_type_id(type_id):
+    if type_id in _UNKNOWN_FINGERPRINT_TYPE_IDS:
         return TypeId.UNKNOWN
     return type_id
 
@@ -1210,7 +1287,7 @@ def _build_schema_fingerprint_type(type_resolver, type_hint, nullable, track_ref
         return f"{type_id},{ref_flag},{nullable_flag}"
 
     if args:
-        if origin is list or origin == typing.List:
+        if origin is list or origin is typing.List:
             elem_type = args[0]
             child = _build_schema_fingerprint_type(
                 type_resolver,
@@ -1221,7 +1298,7 @@ def _build_schema_fingerprint_type(type_resolver, type_hint, nullable, track_ref
                 include_nullable=False,
             )
             return f"{TypeId.LIST},{ref_flag},{nullable_flag}[{child}]"
-        if origin is set or origin == typing.Set:
+        if origin is set or origin is typing.Set:
             elem_type = args[0]
             child = _build_schema_fingerprint_type(
                 type_resolver,
@@ -1232,7 +1309,7 @@ def _build_schema_fingerprint_type(type_resolver, type_hint, nullable, track_ref
                 include_nullable=False,
             )
             return f"{TypeId.SET},{ref_flag},{nullable_flag}[{child}]"
-        if origin is tuple or origin == typing.Tuple:
+        if origin is tuple or origin is typing.Tuple:
             elem_type = get_homogeneous_tuple_elem_type(args)
             if elem_type is None:
                 child = f"{TypeId.UNKNOWN},0,0"
@@ -1246,7 +1323,7 @@ def _build_schema_fingerprint_type(type_resolver, type_hint, nullable, track_ref
                     include_nullable=False,
                 )
             return f"{TypeId.LIST},{ref_flag},{nullable_flag}[{child}]"
-        if origin is dict or origin == typing.Dict:
+        if origin is dict or origin is typing.Dict:
             key_type, value_type = args
             key = _build_schema_fingerprint_type(
                 type_resolver,
@@ -1273,6 +1350,21 @@ def _build_schema_fingerprint_type(type_resolver, type_hint, nullable, track_ref
     return f"{type_id},{ref_flag},{nullable_flag}"
 
 
+def struct_fingerprint_hash(fingerprint: str) -> int:
+    """Hashes a struct fingerprint with MurmurHash3 (seed 47) into a signed Int32."""
+    hash_bytes = fingerprint.encode("utf-8")
+    # Handle empty hash_bytes (no fields or all fields are unknown/dynamic)
+    if not hash_bytes:
+        return 47  # Use seed as default hash for empty structs
+    full_hash = hash_buffer(hash_bytes, seed=47)[0]
+    type_hash_32 = full_hash & 0xFFFFFFFF
+    if full_hash & 0x80000000:
+        # If the sign bit is set, it's a negative number in 2's complement
+        # Subtract 2^32 to get the correct negative value
+        type_hash_32 -= 0x100000000
+    return type_hash_32
+
+
 def compute_struct_meta(type_resolver, field_names, serializers, nullable_map=None, field_infos_list=None):
     """
     Computes struct metadata including version hash, sorted field names, and serializers.
@@ -1289,18 +1381,7 @@ def compute_struct_meta(type_resolver, field_names, serializers, nullable_map=No
 
     # Compute fingerprint string using the new format with field infos
     hash_str = compute_struct_fingerprint(type_resolver, field_names, serializers, nullable_map, field_infos_list)
-    hash_bytes = hash_str.encode("utf-8")
-
-    # Handle empty hash_bytes (no fields or all fields are unknown/dynamic)
-    if len(hash_bytes) == 0:
-        full_hash = 47  # Use seed as default hash for empty structs
-    else:
-        full_hash = hash_buffer(hash_bytes, seed=47)[0]
-    type_hash_32 = full_hash & 0xFFFFFFFF
-    if full_hash & 0x80000000:
-        # If the sign bit is set, it's a negative number in 2's complement
-        # Subtract 2^32 to get the correct negative value
-        type_hash_32 = type_hash_32 - 0x100000000
+    type_hash_32 = struct_fingerprint_hash(hash_str)
     assert type_hash_32 != 0
     if os.environ.get("ENABLE_FORY_DEBUG_OUTPUT", "").lower() in ("1", "true"):
         print(f'[Python][fory-debug] struct version fingerprint="{hash_str}" version hash={type_hash_32}')
@@ -15,6 +15,7 @@
 # specific language governing permissions and limitations
 # under the License.
 
+import linecache
 import os
 import textwrap
 import uuid
@@ -46,3 +47,14 @@ def test_compile_function():
     code, func = codegen.compile_function("test_compile_function", ["x"], ["print(1)", "print(2)", "return x"], {})
     print(code)
     assert func(100) == 100
+
+
+def test_compile_function_reuses_code_for_same_source():
+    stmts = ["return x + offset"]
+    _, func1 = codegen.compile_function("test_compile_reuse", ["x"], stmts, {"offset": 1})
+    cache_size = len(linecache.cache)
+    _, func2 = codegen.compile_function("test_compile_reuse", ["x"], stmts, {"offset": 2})
+    assert len(linecache.cache) == cache_size
+    assert func1.__code__ is func2.__code__
+    assert func1(1) == 2
+    assert func2(1) == 3
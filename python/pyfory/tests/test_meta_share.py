@@ -16,13 +16,14 @@
 # under the License.
 
 import dataclasses
-from typing import Dict, List
+from typing import Dict, List, Optional
 
 import pytest
 
 import pyfory
 from pyfory import Fory
 from pyfory.error import TypeNotCompatibleError
+from pyfory.serialization import Buffer
 
 
 @dataclasses.dataclass
@@ -52,6 +53,18 @@ class ReducedDataClass:
     age: int
 
 
+@dataclasses.dataclass
+class OptionalFieldsClass:
+    name: Optional[str] = None
+    tags: Optional[List[str]] = None
+
+
+@dataclasses.dataclass
+class RequiredFieldsClass:
+    name: str = "unknown"
+    tags: List[str] = dataclasses.field(default_factory=list)
+
+
 @dataclasses.dataclass
 class NestedStructClass:
     name: str
@@ -120,6 +133,28 @@ class TestMetaShareMode:
         with pytest.raises(ValueError, match="not registered in strict mode"):
             reader.deserialize(writer.serialize(SimpleDataClass(name="test", age=25, active=True)))
 
+    def test_unknown_typedef_class_is_shared_across_readers(self):
+        writer = Fory(xlang=True, compatible=True, strict=False)
+        writer.register_type(SimpleDataClass, name="example.UnknownToReader")
+        data = writer.serialize(SimpleDataClass(name="test", age=25, active=True))
+
+        first = Fory(xlang=True, compatible=True, strict=False).deserialize(data)
+        second = Fory(xlang=True, compatible=True, strict=False).deserialize(data)
+        assert type(first) is type(second)
+        assert dataclasses.asdict(first) == dataclasses.asdict(second)
+
+    def test_unknown_typedef_class_is_distinct_per_namespace(self):
+        writer1 = Fory(xlang=True, compatible=True, strict=False)
+        writer1.register_type(SimpleDataClass, name="ns1.Foo")
+        writer2 = Fory(xlang=True, compatible=True, strict=False)
+        writer2.register_type(SimpleDataClass, name="ns2.Foo")
+
+        first = Fory(xlang=True, compatible=True, strict=False).deserialize(writer1.serialize(SimpleDataClass(name="a", age=1, active=True)))
+        second = Fory(xlang=True, compatible=True, strict=False).deserialize(writer2.serialize(SimpleDataClass(name="b", age=2, active=False)))
+        assert type(first) is not type(second)
+        assert first.name == "a"
+        assert second.name == "b"
+
     def test_multiple_objects_same_type(self):
         fory = Fory(xlang=True, compatible=True)
         fory.register_type(SimpleDataClass)
@@ -171,6 +206,51 @@ class TestMetaShareMode:
         assert deserialized.age == 25
         assert not hasattr(deserialized, "active")
 
+    def test_schema_evolution_skips_removed_string_fields(self):
+        fory1 = Fory(xlang=True, compatible=True)
+        fory1.register_type(ExtendedDataClass, name="example.Person")
+        buffer = fory1.serialize(
+            [
+                ExtendedDataClass(name="test", age=25, active=True, email="test@example.com" * 20),
+                ExtendedDataClass(name="other", age=30, active=False, email=""),
+            ]
+        )
+
+        fory2 = Fory(xlang=True, compatible=True)
+        fory2.register_type(ReducedDataClass, name="example.Person")
+        deserialized = fory2.deserialize(buffer)
+
+        assert deserialized == [ReducedDataClass(name="test", age=25), ReducedDataClass(name="other", age=30)]
+
+    def test_schema_evolution_rejects_oversized_removed_string_fields(self):
+        fory1 = Fory(xlang=True, compatible=True)
+        fory1.register_type(ExtendedDataClass, name="example.Person")
+        buffer = fory1.serialize(ExtendedDataClass(name="test", age=25, active=True, email="x" * 128))
+
+        fory2 = Fory(xlang=True, compatible=True, max_binary_size=64)
+        fory2.register_type(ReducedDataClass, name="example.Person")
+        with pytest.raises(ValueError, match="String size 128 exceeds the configured limit of 64"):
+            fory2.deserialize(buffer)
+
+    def test_skip_string_rejects_oversized_length_header(self):
+        buffer = Buffer.allocate(16, max_binary_size=64)
+        buffer.write_var_uint64(65 << 2)
+        read_context = Fory(xlang=True, compatible=True).read_context
+        read_context.prepare(buffer)
+        with pytest.raises(ValueError, match="String size 65 exceeds the configured limit of 64"):
+            read_context.skip_string()
+
+    def test_schema_evolution_defaults_null_for_required_fields(self):
+        fory1 = Fory(xlang=True, compatible=True)
+        fory1.register_type(OptionalFieldsClass, name="example.Tagged")
+        buffer = fory1.serialize([OptionalFieldsClass(), OptionalFieldsClass(name="test", tags=["a"])])
+
+        fory2 = Fory(xlang=True, compatible=True)
+        fory2.register_type(RequiredFieldsClass, name="example.Tagged")
+        deserialized = fory2.deserialize(buffer)
+
+        assert deserialized == [RequiredFieldsClass(), RequiredFieldsClass(name="test", tags=["a"])]
+
     def test_schema_inconsistent_nested_struct(self):
         fory1 = Fory(xlang=True, compatible=True)
         fory1.register_type(NestedStructClass)
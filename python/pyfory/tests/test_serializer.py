@@ -37,6 +37,7 @@ import pytest
 import pyfory
 from pyfory.serialization import Buffer, _bfloat16_from_bits, _bfloat16_to_bits, _float16_from_bits, _float16_to_bits
 from pyfory import Fory, EnumSerializer
+from pyfory.error import TypeUnregisteredError
 from pyfory.serializer import (
     DecimalSerializer,
     TimestampSerializer,
@@ -738,6 +739,42 @@ def test_register_type_name_exclusive():
         fory.register_type(A, type_id=100, name="example.A")
 
 
+@dataclass
+class LenientNamedStruct:
+    name: str = ""
+    age: int = 0
+
+
+@dataclass
+class OtherLenientNamedStruct:
+    name: str = ""
+    age: int = 0
+
+
+@pytest.mark.skipif(pyfory.ENABLE_FORY_CYTHON_SERIALIZATION, reason="Lenient typename lookup is in the Python resolver")
+def test_read_named_type_resolves_single_typename_match():
+    writer = Fory(xlang=True, compatible=False)
+    writer.register_type(LenientNamedStruct, name="ns1.Person")
+    data = writer.serialize(LenientNamedStruct(name="test", age=1))
+
+    reader = Fory(xlang=True, compatible=False, strict=False)
+    reader.register_type(LenientNamedStruct, name="ns2.Person")
+    assert reader.deserialize(data) == LenientNamedStruct(name="test", age=1)
+
+
+@pytest.mark.skipif(pyfory.ENABLE_FORY_CYTHON_SERIALIZATION, reason="Lenient typename lookup is in the Python resolver")
+def test_read_named_type_rejects_ambiguous_typename_match():
+    writer = Fory(xlang=True, compatible=False)
+    writer.register_type(LenientNamedStruct, name="ns1.Person")
+    data = writer.serialize(LenientNamedStruct(name="test", age=1))
+
+    reader = Fory(xlang=True, compatible=False, strict=False)
+    reader.register_type(LenientNamedStruct, name="ns2.Person")
+    reader.register_type(OtherLenientNamedStruct, name="ns3.Person")
+    with pytest.raises(TypeUnregisteredError, match="ns1.Person not registered"):
+        reader.deserialize(data)
+
+
 def test_np_types():
     fory = Fory(xlang=False, ref=True, strict=False, compatible=False)
     o1 = [1, True, np.dtype(np.int32)]
@@ -1048,6 +1085,17 @@ def test_py_serialize_object(track_ref):
     assert ser_de(fory, obj2) == obj2
 
 
+def test_py_serialize_object_with_changing_attributes():
+    fory = Fory(xlang=False, ref=False, strict=False, compatible=False)
+    fory.register_type(SomeTestObject)
+    obj1 = SomeTestObject(f1=1, f2="abc")
+    obj2 = SomeTestObject(f1=2, f2="def")
+    obj2.f3 = [1, 2]
+    obj3 = SomeTestObject(f1=3, f2="ghi")
+    for obj in (obj1, obj2, obj3, obj2):
+        assert ser_de(fory, obj).__dict__ == obj.__dict__
+
+
 @pytest.mark.parametrize("track_ref", [False, True])
 def test_py_serialize_empty_object(track_ref):
     fory = Fory(xlang=False, ref=track_ref, strict=False, compatible=False)
@@ -20,6 +20,7 @@ from dataclasses import dataclass
 import datetime
 import decimal
 import enum
+import linecache
 import math
 from typing import Dict, Any, List, Set, Optional, Tuple
 
@@ -31,6 +32,7 @@ from pyfory import Fory
 from pyfory.error import ForyInvalidDataError, TypeNotCompatibleError, TypeUnregisteredError
 from pyfory.resolver import NOT_NULL_VALUE_FLAG, REF_VALUE_FLAG
 from pyfory.struct import DataClassSerializer, build_default_values_factory
+from pyfory.type_util import get_type_hints
 from pyfory.types import TypeId
 
 
@@ -670,6 +672,36 @@ def test_duration_and_decimal_fields_use_declared_serializers():
     assert serializers["decimal_value"].type_ is decimal.Decimal
 
 
+def test_rebuilding_serializer_does_not_grow_linecache():
+    for compatible in (False, True):
+        fory = Fory(xlang=True, compatible=compatible, ref=True)
+        DataClassSerializer(fory.type_resolver, ComplexObject)
+        cache_size = len(linecache.cache)
+        fory = Fory(xlang=True, compatible=compatible, ref=True)
+        DataClassSerializer(fory.type_resolver, ComplexObject)
+        assert len(linecache.cache) == cache_size
+
+
+def test_mutating_type_hints_does_not_affect_serializers():
+    type_hints = get_type_hints(ComplexObject)
+    type_hints["f3"] = str
+    del type_hints["f4"]
+    assert get_type_hints(ComplexObject)["f3"] is pyfory.Int8
+    fory = Fory(xlang=True, compatible=False, ref=True)
+    fory.register_type(ComplexObject, name="example.ComplexObject")
+    obj = ComplexObject(f3=1, f4=2)
+    assert ser_de(fory, obj) == obj
+
+
+@pytest.mark.skipif(pyfory.ENABLE_FORY_CYTHON_SERIALIZATION, reason="Generated field methods are pure-Python only")
+def test_rebuilt_serializers_share_generated_field_code():
+    first = DataClassSerializer(Fory(xlang=True, compatible=False, ref=True).type_resolver, ComplexObject)
+    second = DataClassSerializer(Fory(xlang=True, compatible=False, ref=True).type_resolver, ComplexObject)
+    assert first._write_fields is not second._write_fields
+    assert first._write_fields.__code__ is second._write_fields.__code__
+    assert first._read_fields.__code__ is second._read_fields.__code__
+
+
 @pytest.mark.parametrize(
     "value, expected",
     [
@@ -1496,3 +1528,17 @@ def test_dynamic_with_inheritance_xlang():
     assert not isinstance(result.animal2, Dog)
     assert result.animal2.name == "Luna"
     assert not hasattr(result.animal2, "breed") or getattr(result.animal2, "breed", None) != "Poodle"
+
+
+def test_stub_serializer_reuses_replacement():
+    from pyfory.struct import DataClassStubSerializer
+
+    fory = Fory(xlang=False, ref=True, strict=False)
+    fory.register(SimpleObject)
+    stub = DataClassStubSerializer(fory.type_resolver, SimpleObject)
+    typeinfo = fory.type_resolver.get_type_info(SimpleObject)
+    typeinfo.serializer = stub
+    replaced = stub._replace()
+    assert type(replaced) is DataClassSerializer
+    assert stub._replace() is replaced
+    assert typeinfo.serializer is replaced
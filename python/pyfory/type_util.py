@@ -20,6 +20,7 @@ import importlib
 import inspect
 
 import typing
+import weakref
 from typing import TypeVar
 from abc import ABC, abstractmethod
 
@@ -64,7 +65,26 @@ def _get_args(type_):
     return args or getattr(type_, "__args__", ())
 
 
+# Resolved hints per class; serializers for the same class are rebuilt for every
+# Fory instance and every received TypeDef, and hint resolution evaluates annotations.
+_type_hints_cache = weakref.WeakKeyDictionary()
+
+
 def get_type_hints(type_):
+    """Returns the resolved type hints of `type_` as a new dict; resolution is cached per class."""
+    try:
+        return dict(_type_hints_cache[type_])
+    except (KeyError, TypeError):
+        pass
+    type_hints = _resolve_type_hints(type_)
+    try:
+        _type_hints_cache[type_] = dict(type_hints)
+    except TypeError:
+        pass
+    return type_hints
+
+
+def _resolve_type_hints(type_):
     try:
         return typing.get_type_hints(type_, include_extras=True)
     except TypeError:
@@ -310,15 +330,15 @@ def infer_field(field_name, type_, visitor: TypeVisitor, types_path=None):
     origin = origin or type_
     args = _get_args(type_)
     if args:
-        if origin is list or origin == typing.List:
+        if origin is list or origin is typing.List:
             elem_type = args[0]
             return visitor.visit_list(field_name, elem_type, types_path=types_path)
-        elif origin is set or origin == typing.Set:
+        elif origin is set or origin is typing.Set:
             elem_type = args[0]
             return visitor.visit_set(field_name, elem_type, types_path=types_path)
-        elif origin is tuple or origin == typing.Tuple:
+        elif origin is tuple or origin is typing.Tuple:
             return visitor.visit_tuple(field_name, args, types_path=types_path)
-        elif origin is dict or origin == typing.Dict:
+        elif origin is dict or origin is typing.Dict:
             key_type, value_type = args
             return visitor.visit_dict(field_name, key_type, value_type, types_path=types_path)
         elif origin is typing.Union: